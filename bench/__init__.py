@@ -0,0 +1,7 @@
+"""Бенчмарки горячих путей FoodLens на синтетических данных.
+
+    python -m bench --users 50 --meals 400 --out bench_results.json
+
+База и папка загрузок — временные (DATABASE_URL / UPLOAD_FOLDER задаются до импорта app),
+OpenAI заменяется заглушкой из bench.stub.
+"""
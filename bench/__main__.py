@@ -0,0 +1,175 @@
+"""python -m bench — прогон сценариев через тестовый клиент Flask, результат в JSON."""
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+SCENARIOS = ("dashboard", "plan", "export_csv", "meal_edit", "admin_index", "upload", "upload_sync")
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def _summary(samples, errors):
+    ms = [s * 1000 for s in samples]
+    if not ms:
+        return {"n": 0, "errors": errors}
+    return {"n": len(ms), "errors": errors, "mean_ms": round(statistics.fmean(ms), 2),
+            "p50_ms": round(_percentile(ms, 0.5), 2), "p95_ms": round(_percentile(ms, 0.95), 2),
+            "p99_ms": round(_percentile(ms, 0.99), 2), "max_ms": round(max(ms), 2)}
+
+def _jpeg(rnd):
+    # своё фото на каждую загрузку, чтобы не попадать в кэш анализа
+    from PIL import Image, ImageDraw
+    img = Image.new("RGB", (1600, 1200), tuple(rnd.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x, y = rnd.randrange(1400), rnd.randrange(1000)
+        draw.ellipse((x, y, x + rnd.randrange(50, 400), y + rnd.randrange(50, 400)),
+                     fill=tuple(rnd.randrange(256) for _ in range(3)))
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+def _client(flask_app, user_id):
+    client = flask_app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = user_id
+    return client
+
+def run(args):
+    import app as A
+    from bench.seed import seed
+    from bench.stub import StubVisionClient
+
+    A.DEMO_MODE = False
+    A.CALIBRATION_SWEEP_ENABLED = False
+    stub = None
+    if not args.openai_url:
+        stub = StubVisionClient(args.llm_latency_ms, args.llm_sigma, args.seed)
+        A.llm_service.start(stub)
+    rnd = random.Random(args.seed)
+
+    flask_app = A.create_app()
+    with flask_app.app_context():
+        t0 = time.perf_counter()
+        ids = seed(A, args.users, args.meals, args.manual, args.days, args.seed)
+        seed_s = time.perf_counter() - t0
+
+    users = ids["user_ids"]
+    admin = _client(flask_app, ids["admin_id"])
+    def as_user():
+        uid = rnd.choice(users)
+        return uid, _client(flask_app, uid)
+
+    def dashboard():
+        return as_user()[1].get("/dashboard")
+    def plan():
+        return as_user()[1].get("/plan")
+    def export_csv():
+        resp = as_user()[1].get("/export.csv")
+        resp.get_data()  # ответ потоковый — дочитываем
+        return resp
+    def meal_edit():
+        uid, client = as_user()
+        return client.post(f"/meal/{ids['meal_ids'][uid]}/edit", data={"comp-0-grams": str(rnd.randint(80, 250))})
+    def admin_index():
+        return admin.get("/admin")
+    def upload():
+        return as_user()[1].post("/upload", data={"photo": (io.BytesIO(_jpeg(rnd)), "bench.jpg")},
+                                 content_type="multipart/form-data")
+    def upload_sync():
+        async_uploads, A.ASYNC_UPLOADS = A.ASYNC_UPLOADS, False
+        try:
+            return upload()
+        finally:
+            A.ASYNC_UPLOADS = async_uploads
+    funcs = {name: fn for name, fn in locals().items() if name in SCENARIOS}
+
+    results = {}
+    for name in args.scenarios:
+        fn = funcs[name]
+        for _ in range(args.warmup):
+            fn()
+        samples, errors = [], 0
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            resp = fn()
+            samples.append(time.perf_counter() - started)
+            if resp.status_code >= 400:
+                errors += 1
+        results[name] = _summary(samples, errors)
+        print(f"{name:12s} " + "  ".join(f"{k}={v}" for k, v in results[name].items()), flush=True)
+    A._analysis_pool.shutdown(wait=True)  # фоновые анализы от upload
+
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.strip()
+    except OSError:
+        rev = ""
+    return {"started_at": datetime.utcnow().isoformat(timespec="seconds"), "git_rev": rev,
+            "config": {k: v for k, v in vars(args).items() if k not in ("out", "baseline")},
+            "seed_seconds": round(seed_s, 2), "llm_stub_calls": stub.calls if stub else None, "scenarios": results}
+
+def compare(report, baseline_path, max_regression):
+    """Список сценариев, у которых p95 вырос больше чем на max_regression (доля)."""
+    with open(baseline_path, encoding="utf-8") as fh:
+        baseline = json.load(fh)["scenarios"]
+    failed = []
+    for name, cur in report["scenarios"].items():
+        base = baseline.get(name)
+        if not base or not base.get("p95_ms") or not cur.get("p95_ms"):
+            continue
+        ratio = cur["p95_ms"] / base["p95_ms"] - 1
+        if ratio > max_regression:
+            failed.append(f"{name}: p95 {base['p95_ms']} -> {cur['p95_ms']} ms (+{ratio:.0%})")
+    return failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description=__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--meals", type=int, default=200, help="фото-блюд на пользователя")
+    parser.add_argument("--manual", type=int, default=50, help="ручных блюд на пользователя")
+    parser.add_argument("--days", type=int, default=90, help="за сколько дней разбросать блюда")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0, help="медиана задержки заглушки модели")
+    parser.add_argument("--llm-sigma", type=float, default=0.4, help="разброс (логнормальный) задержки заглушки")
+    parser.add_argument("--openai-url", help="вместо заглушки — настоящий клиент на этот base URL "
+                                               "(например, python -m bench.fake_openai: http://127.0.0.1:8089/v1)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--baseline", help="прошлый bench_results.json для сравнения")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="допустимый рост p95 (доля)")
+    args = parser.parse_args(argv)
+
+    # своя база и папка загрузок — до импорта app, который читает их при старте
+    workdir = tempfile.mkdtemp(prefix="foodlens-bench-")
+    os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(workdir, "bench.db"))
+    os.environ.setdefault("UPLOAD_FOLDER", os.path.join(workdir, "uploads"))
+    os.makedirs(os.environ["UPLOAD_FOLDER"], exist_ok=True)
+    if args.openai_url:
+        os.environ["OPENAI_BASE_URL"] = args.openai_url
+        os.environ["OPENAI_API_KEY"] = "bench"  # настоящий ключ не уходит на локальный сервер
+
+    report = run(args)
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+    print(f"-> {args.out}")
+    if args.baseline:
+        failed = compare(report, args.baseline, args.max_regression)
+        for line in failed:
+            print("REGRESSION " + line)
+        return 1 if failed else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
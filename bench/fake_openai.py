@@ -0,0 +1,170 @@
+"""Локальный OpenAI-совместимый сервер для нагрузочных тестов сетевого пути анализа.
+
+    python -m bench.fake_openai --port 8089 --latency-ms 800 --rate-429 0.05 --rate-5xx 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=test python app.py
+
+Отвечает на POST /v1/chat/completions: проигрывает записанные ответы (--replay, JSONL: по строке
+на ответ — либо готовый chat.completion, либо JSON содержимого) или готовые ответы bench.stub.
+Умеет задержку, 429 с retry-after, 5xx, ответы с текстом вокруг JSON и битый JSON, а также
+собственный лимит --rpm с заголовками x-ratelimit-*.
+"""
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bench.stub import canned_answer
+
+class FakeOpenAI:
+    def __init__(self, latency_ms=800.0, sigma=0.4, rate_429=0.0, rate_5xx=0.0, rate_wrapped=0.0,
+                 rate_broken=0.0, rpm=0, retry_after=1.0, replay=None, seed=1):
+        self.latency_ms, self.sigma = latency_ms, sigma
+        self.rate_429, self.rate_5xx = rate_429, rate_5xx
+        self.rate_wrapped, self.rate_broken = rate_wrapped, rate_broken
+        self.rpm, self.retry_after = rpm, retry_after
+        self.rnd = random.Random(seed)
+        self.lock = threading.Lock()
+        self.recent = deque()  # время запросов за последнюю минуту — для --rpm
+        self.stats = Counter()
+        self.replay = itertools.cycle(replay) if replay else None
+
+    def _next_content(self):
+        with self.lock:
+            if self.replay is None:
+                return json.dumps(canned_answer(self.rnd), ensure_ascii=False)
+            item = next(self.replay)
+        if isinstance(item, dict) and "choices" in item:
+            return item["choices"][0]["message"]["content"]
+        return item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)
+
+    def _limit_headers(self):
+        """(заголовки x-ratelimit-*, превышен ли --rpm)."""
+        if not self.rpm:
+            return {}, False
+        now = time.monotonic()
+        with self.lock:
+            while self.recent and now - self.recent[0] > 60:
+                self.recent.popleft()
+            over = len(self.recent) >= self.rpm
+            if not over:
+                self.recent.append(now)
+            reset = 60 - (now - self.recent[0]) if self.recent else 0
+            remaining = max(0, self.rpm - len(self.recent))
+        return {"x-ratelimit-limit-requests": str(self.rpm), "x-ratelimit-remaining-requests": str(remaining),
+                "x-ratelimit-reset-requests": f"{reset:.3f}s"}, over
+
+    def handle(self, body: dict):
+        """-> (status, headers, payload bytes)."""
+        headers, over = self._limit_headers()
+        with self.lock:
+            roll = self.rnd.random()
+            delay = self.latency_ms / 1000.0 * self.rnd.lognormvariate(0, self.sigma)
+        if over or roll < self.rate_429:
+            self.stats["429"] += 1
+            headers["retry-after"] = f"{self.retry_after:g}"
+            return 429, headers, _error("Rate limit reached (fake)", "rate_limit_exceeded")
+        time.sleep(delay)
+        roll -= self.rate_429
+        if roll < self.rate_5xx:
+            self.stats["5xx"] += 1
+            return 503, headers, _error("The server is overloaded (fake)", "server_error")
+        roll -= self.rate_5xx
+        content = self._next_content()
+        if roll < self.rate_wrapped:
+            self.stats["wrapped"] += 1
+            content = "Вот оценка блюда:\n```json\n" + content + "\n```"
+        elif roll - self.rate_wrapped < self.rate_broken:
+            self.stats["broken"] += 1
+            content = content[: len(content) // 2]
+        else:
+            self.stats["ok"] += 1
+        payload = {
+            "id": "chatcmpl-" + uuid.uuid4().hex[:24], "object": "chat.completion", "created": int(time.time()),
+            "model": body.get("model") or "gpt-4o",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 850, "completion_tokens": 350, "total_tokens": 1200},
+        }
+        return 200, headers, json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+def _error(message, code):
+    return json.dumps({"error": {"message": message, "type": code, "code": code}}).encode("utf-8")
+
+def make_server(fake: FakeOpenAI, host="127.0.0.1", port=8089, verbose=False) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, как у настоящего API
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._send(404, {}, _error("Unknown path", "not_found"))
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                return self._send(400, {}, _error("Invalid JSON body", "invalid_request_error"))
+            self._send(*fake.handle(request))
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                models = [{"id": m, "object": "model", "owned_by": "fake"} for m in ("gpt-4o", "gpt-4o-mini")]
+                return self._send(200, {}, json.dumps({"object": "list", "data": models}).encode("utf-8"))
+            self._send(404, {}, _error("Unknown path", "not_found"))
+
+        def _send(self, status, headers, payload):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, fmt, *args):
+            if verbose:
+                super().log_message(fmt, *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+def _load_replay(path):
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench.fake_openai", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="медиана задержки ответа")
+    parser.add_argument("--sigma", type=float, default=0.4, help="разброс (логнормальный) задержки")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="доля ответов 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="доля ответов 503")
+    parser.add_argument("--rate-wrapped", type=float, default=0.0, help="доля ответов с текстом вокруг JSON")
+    parser.add_argument("--rate-broken", type=float, default=0.0, help="доля ответов с обрезанным JSON")
+    parser.add_argument("--rpm", type=int, default=0, help="свой лимит запросов в минуту (0 — без лимита)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="retry-after для 429, сек")
+    parser.add_argument("--replay", help="JSONL с записанными ответами")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    fake = FakeOpenAI(args.latency_ms, args.sigma, args.rate_429, args.rate_5xx, args.rate_wrapped,
+                      args.rate_broken, args.rpm, args.retry_after,
+                      _load_replay(args.replay) if args.replay else None, args.seed)
+    server = make_server(fake, args.host, args.port, args.verbose)
+    print(f"fake OpenAI on http://{args.host}:{server.server_port}/v1", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(dict(fake.stats))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Время холодного старта: `import app` и `create_app()` в свежем процессе.
+
+    python -m bench.import_time --runs 7 --max-import-ms 1000
+
+Код возврата 1, если медиана импорта дольше --max-import-ms или при старте подгрузился тяжёлый модуль
+из --forbid (по умолчанию openai, PIL, numpy: они нужны только при анализе фото и пересчёте).
+База — временная SQLite, так что create_app включает и проверку миграций на пустой базе.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+HEAVY_MODULES = ("openai", "PIL", "numpy")
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+app.create_app()
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "create_app_ms": (t2 - t1) * 1000,
+                  "modules": sorted({m.split(".")[0] for m in sys.modules})}))
+"""
+
+def probe(env):
+    out = subprocess.run([sys.executable, "-c", _PROBE], env=env, capture_output=True, text=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if out.returncode:
+        sys.exit(out.stderr)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench.import_time", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None, help="порог медианы import app")
+    parser.add_argument("--forbid", nargs="*", default=list(HEAVY_MODULES),
+                        help="модули, которых не должно быть после import app + create_app()")
+    parser.add_argument("--out", help="записать результат в JSON")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="foodlens-import-")
+    env = dict(os.environ, DATABASE_URL="sqlite:///" + os.path.join(workdir, "import.db"),
+               UPLOAD_FOLDER=os.path.join(workdir, "uploads"))
+    probe(env)  # прогрев: .pyc и создание схемы не входят в замер
+    runs = [probe(env) for _ in range(args.runs)]
+    loaded = sorted(set(args.forbid) & set(runs[-1]["modules"]))
+    report = {
+        "runs": args.runs,
+        "import_ms": round(statistics.median(r["import_ms"] for r in runs), 1),
+        "create_app_ms": round(statistics.median(r["create_app_ms"] for r in runs), 1),
+        "heavy_modules_loaded": loaded,
+    }
+    print(f"import app   {report['import_ms']:8.1f} ms (median of {args.runs})")
+    print(f"create_app() {report['create_app_ms']:8.1f} ms")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+    failed = []
+    if loaded:
+        failed.append("heavy modules imported at startup: " + ", ".join(loaded))
+    if args.max_import_ms is not None and report["import_ms"] > args.max_import_ms:
+        failed.append(f"import app {report['import_ms']} ms > {args.max_import_ms} ms")
+    for line in failed:
+        print("REGRESSION " + line)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
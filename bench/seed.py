@@ -0,0 +1,76 @@
+"""Синтетические данные для бенчмарков: пользователи, профили, фото- и ручные блюда с компонентами."""
+import json
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import func, insert
+
+from bench.stub import CANNED
+
+MANUAL_NAMES = ["Йогурт", "Яблоко", "Кофе с молоком", "Сэндвич", "Протеиновый батончик", "Каша овсяная"]
+
+def _components(rnd: random.Random):
+    comps = json.loads(json.dumps(rnd.choice(CANNED)["components"]))
+    for c in comps:
+        c["est_grams"] = round(c["est_grams"] * rnd.uniform(0.6, 1.6), 1)
+    return comps
+
+def seed(A, users: int = 20, meals: int = 200, manual: int = 50, days: int = 90, seed: int = 1) -> dict:
+    """Заполняет базу приложения A (модуль app). Возвращает id пользователей, админа и блюд для сценариев."""
+    rnd = random.Random(seed)
+    db = A.db
+    now = datetime.utcnow()
+    when = lambda: now - timedelta(days=rnd.uniform(0, days))
+    password_hash = A.generate_password_hash("bench")
+
+    admin = A.User(email=f"bench-admin-{seed}@example.com", password_hash=password_hash,
+                   display_name="Bench admin", is_admin=True)
+    db.session.add(admin)
+    user_rows = [A.User(email=f"bench-{seed}-{i}@example.com", password_hash=password_hash, display_name=f"Bench {i}")
+                 for i in range(users)]
+    db.session.add_all(user_rows)
+    db.session.flush()
+    user_ids = [u.id for u in user_rows]
+    db.session.add_all(A.Profile(user_id=uid, age=rnd.randint(18, 60), sex=rnd.choice(["male", "female"]),
+                                 height_cm=rnd.uniform(155, 195), weight_kg=rnd.uniform(50, 110),
+                                 activity="moderate", goal=rnd.choice(["lose", "maintain", "gain"]),
+                                 tracking_enabled_at=now - timedelta(days=days))
+                       for uid in user_ids)
+    db.session.commit()
+
+    next_id = (db.session.query(func.max(A.MealPhoto.id)).scalar() or 0) + 1
+    meal_ids = {}
+    for uid in user_ids:
+        photo_rows, comp_rows = [], []
+        for _ in range(meals):
+            data = {"components": _components(rnd), "vessel": "plate", "size_class": "medium", "fill_level": "medium"}
+            data["components"] = A._calibrate_components(data["components"], "plate", "medium", "medium")
+            A._finalize_totals(data)
+            photo_rows.append({
+                "id": next_id, "user_id": uid, "filename": "bench.jpg", "dish_name": "Bench meal",
+                "calories_kcal": data["calories_kcal"], "proteins_g": data["proteins_g"], "fats_g": data["fats_g"],
+                "carbs_g": data["carbs_g"], "portion_grams": data["portion_grams"], "confidence": 0.85,
+                "notes": "bench", "components_json": json.dumps(data["components"], ensure_ascii=False),
+                "vessel": "plate", "size_class": "medium", "fill_level": "medium",
+                "count_in_tracking": rnd.random() < 0.9, "status": "done",
+                "calibration_version": A.CALIBRATION_VERSION, "analysis_tier": "primary", "created_at": when(),
+            })
+            for pos, comp in enumerate(data["components"]):
+                row = vars(A._fill_component(SimpleNamespace(), comp, pos))
+                comp_rows.append(dict(row, meal_id=next_id))
+            meal_ids.setdefault(uid, next_id)
+            next_id += 1
+        manual_rows = [{"user_id": uid, "name": rnd.choice(MANUAL_NAMES), "calories_kcal": rnd.uniform(50, 600),
+                        "proteins_g": rnd.uniform(0, 30), "fats_g": rnd.uniform(0, 25), "carbs_g": rnd.uniform(0, 80),
+                        "portion_grams": rnd.uniform(50, 400), "count_in_tracking": True, "created_at": when()}
+                       for _ in range(manual)]
+        if photo_rows:
+            db.session.execute(insert(A.MealPhoto), photo_rows)
+            db.session.execute(insert(A.MealComponent), comp_rows)
+        if manual_rows:
+            db.session.execute(insert(A.ManualMeal), manual_rows)
+        db.session.commit()
+    A.rebuild_daily_totals()
+    A.rebuild_stat_counters()
+    return {"admin_id": admin.id, "user_ids": user_ids, "meal_ids": meal_ids}
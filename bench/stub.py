@@ -0,0 +1,55 @@
+"""Заглушка AsyncOpenAI для бенчмарков: готовый JSON компонентов и настраиваемая задержка."""
+import asyncio
+import json
+import random
+from types import SimpleNamespace
+
+CANNED = [
+    {"dish_name": "Курица с рисом", "vessel": "plate", "size_class": "medium", "fill_level": "medium",
+     "components": [
+         {"name": "Рис отварной", "tags": ["rice"], "cooked_state": "cooked", "method": "boiled", "count": None,
+          "est_grams": 180, "per100_kcal_used": 130, "proteins_g": 4.9, "fats_g": 0.5, "carbs_g": 50.4},
+         {"name": "Куриная грудка", "tags": ["chicken"], "cooked_state": "cooked", "method": "grill", "count": None,
+          "est_grams": 120, "per100_kcal_used": 165, "proteins_g": 37.2, "fats_g": 4.3, "carbs_g": 0},
+     ]},
+    {"dish_name": "Омлет с овощами", "vessel": "plate", "size_class": "small", "fill_level": "medium",
+     "components": [
+         {"name": "Яйцо", "tags": ["egg"], "cooked_state": "cooked", "method": "fried", "count": 2,
+          "est_grams": 110, "per100_kcal_used": 196, "proteins_g": 13.8, "fats_g": 16.5, "carbs_g": 0.9},
+         {"name": "Помидоры", "tags": ["vegetable", "tomato"], "cooked_state": "raw", "method": None, "count": None,
+          "est_grams": 80, "per100_kcal_used": 20, "proteins_g": 0.9, "fats_g": 0.2, "carbs_g": 3.1},
+     ]},
+]
+
+def canned_answer(rnd: random.Random) -> dict:
+    data = json.loads(json.dumps(rnd.choice(CANNED)))
+    comps = data["components"]
+    data["portion_grams"] = sum(c["est_grams"] for c in comps)
+    data["calories_kcal"] = round(sum(c["per100_kcal_used"] * c["est_grams"] / 100 for c in comps), 1)
+    for key in ("proteins_g", "fats_g", "carbs_g"):
+        data[key] = round(sum(c[key] for c in comps), 1)
+    data["confidence"] = 0.85
+    data["notes"] = "bench stub"
+    return data
+
+class StubVisionClient:
+    """Повторяет нужный кусок интерфейса AsyncOpenAI: chat.completions.with_raw_response.create."""
+
+    def __init__(self, latency_ms: float = 800.0, sigma: float = 0.4, seed: int = 1):
+        self.latency_ms = latency_ms
+        self.sigma = sigma
+        self.rnd = random.Random(seed)
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(
+            with_raw_response=SimpleNamespace(create=self._create)))
+
+    async def _create(self, model, messages, **kwargs):
+        self.calls += 1
+        # логнормальная задержка: медиана latency_ms, хвост задаёт sigma
+        await asyncio.sleep(self.latency_ms / 1000.0 * self.rnd.lognormvariate(0, self.sigma))
+        answer = canned_answer(self.rnd)
+        resp = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(answer, ensure_ascii=False)))],
+            usage=SimpleNamespace(prompt_tokens=850, completion_tokens=350),
+        )
+        return SimpleNamespace(headers={}, parse=lambda: resp)
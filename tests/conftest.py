@@ -0,0 +1,24 @@
+import pytest
+
+import app as A
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Приложение на своей временной SQLite и папке загрузок."""
+    return A.create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/t.db",
+                         "UPLOAD_FOLDER": str(tmp_path / "uploads")})
+
+
+@pytest.fixture
+def client(app):
+    """Тестовый клиент, вошедший как обычный пользователь."""
+    with app.app_context():
+        user = A.User(email="user@example.com", password_hash="!")
+        A.db.session.add(user)
+        A.db.session.commit()
+        user_id = user.id
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = user_id
+    return client
@@ -0,0 +1,33 @@
+import app as A
+
+
+def _flip(phash, *bits):
+    value = int(phash, 16)
+    for bit in bits:
+        value ^= 1 << bit
+    return f"{value:016x}"
+
+
+PHASH = "f0e1d2c3b4a59687"
+
+
+def test_near_duplicates_are_off_by_default(app):
+    with app.app_context():
+        A._cache_store("a" * 64, PHASH, {"dish_name": "Плов"})
+        assert A._cache_lookup("b" * 64, _flip(PHASH, 0)) is None
+        assert A._cache_lookup("a" * 64, PHASH)[0]["dish_name"] == "Плов"
+
+
+def test_cache_hit_is_reported_as_cache_tier(app):
+    with app.app_context():
+        A._cache_store("a" * 64, PHASH, {"dish_name": "Плов"}, tier="primary")
+        assert A._cache_lookup("a" * 64, PHASH)[1] == "cache"
+
+
+def test_near_duplicate_found_through_bands(app, monkeypatch):
+    monkeypatch.setattr(A, "ANALYSIS_CACHE_PHASH_DISTANCE", 3)
+    with app.app_context():
+        A._cache_store("a" * 64, PHASH, {"dish_name": "Плов"})
+        # по одному биту в трёх четвертях — четвёртая совпадает
+        assert A._cache_lookup("b" * 64, _flip(PHASH, 1, 17, 33))[0]["dish_name"] == "Плов"
+        assert A._cache_lookup("c" * 64, _flip(PHASH, 1, 2, 17, 33)) is None
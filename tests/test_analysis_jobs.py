@@ -0,0 +1,27 @@
+import app as A
+
+
+def test_failed_commit_marks_meal_retryable(app, monkeypatch):
+    with app.app_context():
+        meal = A.MealPhoto(user_id=1, filename="x.jpg", status="pending")
+        A.db.session.add(meal)
+        A.db.session.commit()
+        meal_id = meal.id
+
+    monkeypatch.setattr(A, "analyze_jpeg", lambda raw: {"dish_name": "Плов", "components": []})
+    real_commit, calls = A.db.session.commit, []
+
+    def commit():
+        calls.append(1)
+        if len(calls) == 1:
+            raise A.OperationalError("COMMIT", {}, Exception("database is locked"))
+        return real_commit()
+
+    monkeypatch.setattr(A.db.session, "commit", commit)
+    A._run_analysis_job(app, meal_id, b"")
+    monkeypatch.undo()
+
+    with app.app_context():
+        meal = A.db.session.get(A.MealPhoto, meal_id)
+        assert meal.status == "error"
+        assert A._analysis_is_stale(meal)
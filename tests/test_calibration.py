@@ -0,0 +1,47 @@
+import json
+
+import app as A
+
+# переполненная миска: калибровка масштабирует граммы, поэтому повторная калибровка
+# уже откалиброванных компонентов даёт другие калории
+RAW = [
+    {"name": "chicken_thigh", "tags": ["chicken_thigh"], "est_grams": 400, "count": 2, "method": "boiled"},
+    {"name": "bread", "tags": ["bread"], "est_grams": 900, "count": 0, "method": "boiled"},
+    {"name": "rice", "tags": ["rice"], "est_grams": 400, "count": 6, "method": "fried"},
+]
+
+
+def _add_meal(user_id, created_at=None):
+    data = {"vessel": "bowl", "size_class": "medium", "fill_level": "low", "components": json.loads(json.dumps(RAW))}
+    data["raw_components"] = json.loads(json.dumps(RAW))
+    data["components"] = A._calibrate_components(data["components"], "bowl", "medium", "low")
+    meal = A.MealPhoto(user_id=user_id, filename="x.jpg", created_at=created_at)
+    A._apply_analysis(meal, A._finalize_totals(data))
+    A.db.session.add(meal)
+    A.rollup_meal(meal, +1)
+    A.db.session.commit()
+    return meal
+
+
+def test_rescore_starts_from_raw_answer(app):
+    with app.app_context():
+        meal = _add_meal(user_id=1)
+        kcal = meal.calories_kcal
+        for _ in range(3):
+            meal.calibration_version = "old"
+            A.db.session.commit()
+            assert A.rescore_meal(meal)
+            A.db.session.commit()
+            assert meal.calories_kcal == kcal
+
+
+def test_lazy_rescore_is_bounded(app, monkeypatch):
+    monkeypatch.setattr(A, "CALIBRATION_LAZY_LIMIT", 3)
+    with app.app_context():
+        for _ in range(5):
+            _add_meal(user_id=1)
+        A.db.session.execute(A.update(A.MealPhoto).values(calibration_version="old"))
+        A.db.session.commit()
+        assert A.ensure_current_calibration(1) == 3
+        stale = A.db.session.scalar(A.select(A.func.count()).select_from(A.MealPhoto).where(A._calibration_stale()))
+        assert stale == 2
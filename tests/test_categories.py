@@ -0,0 +1,65 @@
+import pytest
+
+import app as A
+
+# Ожидания — ответы прежней цепочки if в canonical_category (до таблицы CATEGORY_RULES):
+# по одному примеру на правило, совпадения нескольких правил (побеждает более раннее), регистр,
+# слова только в тегах и умолчание "unknown".
+CASES = [
+    ("Паста карбонара", [], "pasta"),
+    ("Penne arrabbiata", ["pasta"], "pasta"),
+    ("Рис с курицей", ["rice", "chicken"], "rice"),
+    ("Рисовая каша", [], "rice"),
+    ("Гречка с грибами", [], "buckwheat"),
+    ("Картофель фри", ["fried"], "potato"),
+    ("Mashed potatoes", [], "potato"),
+    ("Хлеб ржаной", [], "bread"),
+    ("Baguette", [], "bread"),
+    ("Бургер", ["bun", "beef"], "bread"),
+    ("Хот-дог", ["hot dog"], "sausages"),
+    ("Сосиски", [], "sausages"),
+    ("Колбаса докторская", [], "sausages"),
+    ("Chicken breast", ["chicken"], "chicken_breast"),
+    ("Куриная грудка", [], "chicken_breast"),
+    ("Куриные ножки", [], "chicken_drumstick"),
+    ("Chicken thigh", [], "chicken_thigh"),
+    ("Лосось на гриле", [], "salmon"),
+    ("Семга", [], "salmon"),
+    ("Fish and chips", [], "fish_lean"),
+    ("Рыба", ["fish"], "fish_lean"),
+    ("Стейк рибай", [], "beef_steak"),
+    ("Говядина тушёная", [], "beef_steak"),
+    ("Pork chop", [], "pork"),
+    ("Свинина", [], "pork"),
+    ("Суши сет", [], "sushi"),
+    ("Сыр", [], "cheese"),
+    ("Cheese plate", [], "cheese"),
+    ("Сырники", [], "cheese"),
+    ("Пельмени", [], "dumplings"),
+    ("Манты", [], "dumplings"),
+    ("Огурец", [], "vegetables"),
+    ("Помидоры черри", ["vegetable", "tomato"], "vegetables"),
+    ("Овощное рагу", [], "vegetables"),
+    ("Яблоко", ["fruit"], "fruits"),
+    ("Банан", [], "fruits"),
+    ("Ягодный смузи", [], "fruits"),
+    # несколько правил сразу — порядок прежней цепочки
+    ("Sushi", ["rice"], "rice"),
+    ("Рыба с рисом", [], "rice"),
+    ("Стейк из лосося", [], "salmon"),
+    ("Салат с грудкой", ["salad"], "chicken_breast"),
+    ("Greek salad", ["cheese", "vegetable"], "cheese"),
+    ("Вареники с картошкой", [], "dumplings"),
+    ("Бутерброд с колбасой", ["bread"], "bread"),
+    ("PASTA", ["RICE"], "pasta"),
+    # ничего не подошло; слово не склеивается через границу названия и тегов
+    ("Омлет", ["eggs"], "unknown"),
+    ("Борщ", [], "unknown"),
+    ("", [], "unknown"),
+    ("Ри", ["с"], "unknown"),
+]
+
+
+@pytest.mark.parametrize("name, tags, expected", CASES)
+def test_category_table_matches_old_if_chain(name, tags, expected):
+    assert A.canonical_category(name, tags) == expected
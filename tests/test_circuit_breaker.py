@@ -0,0 +1,46 @@
+import asyncio
+
+import app as A
+
+
+def _open_breaker(service):
+    # окно из одних ошибок, кулдаун уже прошёл — следующий allow() пустит пробный вызов
+    for _ in range(A.BREAKER_MIN_CALLS):
+        service._breaker.record(False)
+    assert service._breaker.is_open
+    service._breaker.open_until = A.monotonic() - 1
+
+
+def test_probe_cancelled_by_hedge_rearms_cooldown(monkeypatch):
+    monkeypatch.setattr(A, "HEDGE_ENABLED", True)
+    monkeypatch.setattr(A, "HEDGE_DEFAULT_DELAY", 0.01)
+    monkeypatch.setattr(A, "BREAKER_COOLDOWN", 0.05)
+    service = A.LLMService()
+    primary_calls = []
+
+    async def analyze(data_url, model, detail):
+        if model == A.OPENAI_VISION_MODEL:
+            primary_calls.append(model)
+            if len(primary_calls) == 1:
+                await asyncio.sleep(1)  # пробный вызов медлит и проигрывает хеджу
+            return {"who": "primary"}
+        return {"who": "fallback"}
+
+    monkeypatch.setattr(service, "analyze", analyze)
+    _open_breaker(service)
+
+    async def scenario():
+        _, tier = await service.analyze_hedged("data:", "low")
+        assert tier == "fallback"
+        await asyncio.sleep(0)  # дать отменённой задаче отработать CancelledError
+        assert not service._breaker.probing
+        # до конца нового кулдауна — сразу резервная
+        assert not service._breaker.allow()
+        await asyncio.sleep(0.06)
+        # основная восстановилась: следующий пробный вызов проходит и закрывает предохранитель
+        _, tier = await service.analyze_hedged("data:", "low")
+        assert tier == "primary"
+        assert not service._breaker.is_open
+
+    asyncio.run(scenario())
+    assert len(primary_calls) == 2
@@ -0,0 +1,50 @@
+import threading
+from datetime import datetime, timedelta
+
+import app as A
+from bench.seed import seed
+
+
+def test_concurrent_runs_of_one_job_count_rows_once(app, monkeypatch):
+    monkeypatch.setattr(A, "DELETION_CHUNK", 7)
+    monkeypatch.setattr(A, "DELETION_PAUSE", 0)
+    with app.app_context():
+        ids = seed(A, users=2, meals=40, manual=20)
+        user_id = ids["user_ids"][0]
+        job = A.DeletionJob(user_id=user_id, email="x@example.com", status="pending")
+        A.db.session.add(job)
+        A.db.session.commit()
+        job_id = job.id
+        before = A.stat_counters()
+        photos = A.db.session.query(A.MealPhoto).filter_by(user_id=user_id).count()
+        manual = A.db.session.query(A.ManualMeal).filter_by(user_id=user_id).count()
+
+    # два воркера подхватили одну задачу (resume_deletion_jobs в каждом процессе)
+    workers = [threading.Thread(target=A._run_deletion_job, args=(app, job_id)) for _ in range(3)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    with app.app_context():
+        job = A.db.session.get(A.DeletionJob, job_id)
+        assert job.status == "done"
+        assert (job.photo_deleted, job.manual_deleted) == (photos, manual)
+        after = A.stat_counters()
+        assert after["meals_photo"] == before["meals_photo"] - photos
+        assert after["meals_manual"] == before["meals_manual"] - manual
+        assert after["meals_photo"] == A.db.session.scalar(A.select(A.func.count()).select_from(A.MealPhoto))
+
+
+def test_running_job_is_claimed_only_after_heartbeat_goes_stale(app):
+    with app.app_context():
+        job = A.DeletionJob(user_id=1, email="x@example.com", status="running", owner="other",
+                            heartbeat_at=datetime.utcnow())
+        A.db.session.add(job)
+        A.db.session.commit()
+        assert not A._claim_deletion_job(job.id, "me")
+        job.heartbeat_at = datetime.utcnow() - timedelta(seconds=A.DELETION_STALE_AFTER + 1)
+        A.db.session.commit()
+        assert A._claim_deletion_job(job.id, "me")
+        A.db.session.refresh(job)
+        assert job.owner == "me"
@@ -0,0 +1,34 @@
+import io
+import os
+
+import pytest
+
+import app as A
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _jpeg():
+    buf = io.BytesIO()
+    Image.new("RGB", (1200, 900), (200, 120, 40)).save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+
+def test_derivative_etag_follows_content_not_mtime(app, client):
+    folder = app.config["UPLOAD_FOLDER"]
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, "meal.jpg"), "wb") as fh:
+        fh.write(_jpeg())
+    url = "/uploads/w320/webp/meal.jpg"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert "immutable" in first.headers["Cache-Control"]
+    etag = first.headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    # копию пересобрали (новый mtime, те же байты) — ETag прежний, кэш браузера остаётся верным
+    path = os.path.join(folder, A.DERIVATIVE_DIR, A._derivative_name("meal.jpg", 320, "webp"))
+    os.remove(path)
+    again = client.get(url)
+    assert again.headers["ETag"] == etag
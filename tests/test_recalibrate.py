@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+import app as A
+
+np = pytest.importorskip("numpy")
+
+CASES = {
+    "over capacity": ("bowl", "medium", "low", [
+        {"name": "chicken_thigh", "tags": ["chicken_thigh"], "est_grams": 400, "count": 2, "method": "boiled"},
+        {"name": "bread", "tags": ["bread"], "est_grams": 900, "count": 0, "method": "boiled"},
+        {"name": "rice", "tags": ["rice"], "est_grams": 400, "count": 6, "method": "fried"},
+    ]),
+    "pieces below typical weight": ("plate", "small", "medium", [
+        {"name": "chicken_wing", "tags": ["chicken_wing"], "est_grams": 20, "count": 6, "method": "fried"},
+        {"name": "sausages", "tags": ["sausages"], "est_grams": 5, "count": 3},
+    ]),
+    "unknown method and no category": ("plate", "large", "high", [
+        {"name": "Что-то своё", "tags": [], "est_grams": 137.5, "method": "smoked"},
+        {"name": "Паста", "tags": ["pasta"], "est_grams": "212.25", "method": "sous-vide"},
+    ]),
+    "protein cap": ("plate", "medium", "medium", [
+        {"name": "Куриная грудка", "tags": ["chicken", "breast"], "est_grams": 250, "method": "grill"},
+        {"name": "salmon", "tags": ["salmon"], "est_grams": 175, "method": "baked"},
+    ]),
+    "rounding ties": ("plate", "medium", "medium", [
+        {"name": "rice", "tags": ["rice"], "est_grams": 5.5, "count": None},
+        {"name": "vegetables", "tags": ["vegetable"], "est_grams": 12.5, "method": "steamed"},
+        {"name": "Огурец", "tags": ["vegetable"], "est_grams": 0},
+    ]),
+}
+
+
+def _scalar(vessel, size_class, fill_level, components):
+    comps = A._calibrate_components(json.loads(json.dumps(components)), vessel, size_class, fill_level)
+    return A._finalize_totals({"components": comps})
+
+
+def _add_meal(vessel, size_class, fill_level, components, with_raw=True):
+    result = _scalar(vessel, size_class, fill_level, components)
+    result.update(vessel=vessel, size_class=size_class, fill_level=fill_level,
+                  raw_components=json.loads(json.dumps(components)) if with_raw else None)
+    meal = A.MealPhoto(user_id=1, filename="x.jpg")
+    A._apply_analysis(meal, result)
+    if not with_raw:
+        meal.raw_components_json = None  # блюдо из времени до raw_components_json
+    meal.calibration_version = "old"
+    A.db.session.add(meal)
+    A.rollup_meal(meal, +1)
+    A.db.session.commit()
+    return meal.id
+
+
+def _assert_same(meal_id, expected):
+    A.db.session.expire_all()
+    meal = A.db.session.get(A.MealPhoto, meal_id)
+    assert meal.calibration_version == A.CALIBRATION_VERSION
+    got = A.meal_components(meal)
+    assert [c["est_grams"] for c in got] == [c["est_grams"] for c in expected["components"]]
+    assert [c["calories_kcal"] for c in got] == [c["calories_kcal"] for c in expected["components"]]
+    assert [c["category"] for c in got] == [c["category"] for c in expected["components"]]
+    assert (meal.portion_grams, meal.calories_kcal, meal.proteins_g) == \
+        (expected["portion_grams"], expected["calories_kcal"], expected["proteins_g"])
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_vectorized_matches_scalar_from_raw_answer(app, case):
+    vessel, size_class, fill_level, components = CASES[case]
+    with app.app_context():
+        meal_id = _add_meal(vessel, size_class, fill_level, components)
+        for _ in range(2):  # повторный прогон не сдвигает результат
+            A.recalibrate_meals(np)
+            _assert_same(meal_id, _scalar(vessel, size_class, fill_level, components))
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_vectorized_matches_scalar_on_legacy_rows(app, case):
+    vessel, size_class, fill_level, components = CASES[case]
+    with app.app_context():
+        meal_id = _add_meal(vessel, size_class, fill_level, components, with_raw=False)
+        stored = A.meal_components(A.db.session.get(A.MealPhoto, meal_id))
+        A.recalibrate_meals(np)
+        _assert_same(meal_id, _scalar(vessel, size_class, fill_level, stored))